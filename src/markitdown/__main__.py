@@ -59,14 +59,12 @@ def main():
     )
     args = parser.parse_args()
 
+    markitdown = MarkItDown()
     if args.filename is None:
-        markitdown = MarkItDown()
         result = markitdown.convert_stream(sys.stdin.buffer)
-        _handle_output(args, result)
     else:
-        markitdown = MarkItDown()
         result = markitdown.convert(args.filename)
-        _handle_output(args, result)
+    _handle_output(args, result)
 
 
 def _handle_output(args, result: DocumentConverterResult):
@@ -2,6 +2,7 @@
 import base64
 import binascii
 import copy
+import functools
 import html
 import json
 import mimetypes
@@ -13,8 +14,9 @@ import sys
 import tempfile
 import traceback
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from xml.dom import minidom
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
 from urllib.parse import parse_qs, quote, unquote, urlparse, urlunparse
 from warnings import warn, resetwarnings, catch_warnings
@@ -31,6 +33,8 @@ import pptx
 import puremagic
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from charset_normalizer import from_path
 
 # Optional Transcription support
@@ -59,6 +63,48 @@ try:
 except ModuleNotFoundError:
     pass
 
+# File extensions accepted by converters that handle more than one extension
+HTML_EXTENSIONS = frozenset([".html", ".htm"])
+RSS_EXTENSIONS = frozenset([".xml", ".rss", ".atom"])
+IMAGE_EXTENSIONS = frozenset([".jpg", ".jpeg", ".png"])
+
+# Output normalization. Stripping whitespace (including any '\r') that precedes a
+# newline or the end of the text is equivalent to splitting on '\r?\n', rstrip()ing
+# every line and re-joining, without materializing a list of lines. The lookbehind
+# only lets a match start at the beginning of a whitespace run, which keeps long
+# runs that are not at the end of a line from backtracking quadratically.
+_TRAILING_WHITESPACE_RE = re.compile(r"[^\S\n](?<![^\S\n]{2})[^\S\n]*(?=\n|\Z)")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+# Upper bound on the total uncompressed size of a zip file's contents, in bytes
+ZIP_MAX_EXTRACTED_SIZE = 2 * 1024**3
+
+# exiftool metadata fields reported by the media converters, in output order
+AUDIO_METADATA_FIELDS = (
+    "Title",
+    "Artist",
+    "Author",
+    "Band",
+    "Album",
+    "Genre",
+    "Track",
+    "DateTimeOriginal",
+    "CreateDate",
+    "Duration",
+)
+IMAGE_METADATA_FIELDS = (
+    "ImageSize",
+    "Title",
+    "Caption",
+    "Description",
+    "Keywords",
+    "Artist",
+    "Author",
+    "DateTimeOriginal",
+    "CreateDate",
+    "GPSPosition",
+)
+
 
 class _CustomMarkdownify(markdownify.MarkdownConverter):
     """
@@ -142,6 +188,12 @@ class _CustomMarkdownify(markdownify.MarkdownConverter):
         return super().convert_soup(soup)  # type: ignore
 
 
+@functools.lru_cache(maxsize=1)
+def _markdownify() -> _CustomMarkdownify:
+    """Return a shared _CustomMarkdownify instance. The converter holds no per-document state, so it is safe to reuse."""
+    return _CustomMarkdownify()
+
+
 class DocumentConverterResult:
     """The result of converting a document to text."""
 
@@ -173,10 +225,7 @@ class PlainTextConverter(DocumentConverter):
         # Only accept text files
         if content_type is None:
             return None
-        elif all(
-            not content_type.lower().startswith(type_prefix)
-            for type_prefix in ["text/", "application/json"]
-        ):
+        elif not content_type.lower().startswith(("text/", "application/json")):
             return None
 
         text_content = str(from_path(local_path).best())
@@ -194,7 +243,7 @@ class HtmlConverter(DocumentConverter):
     ) -> Union[None, DocumentConverterResult]:
         # Bail if not html
         extension = kwargs.get("file_extension", "")
-        if extension.lower() not in [".html", ".htm"]:
+        if extension.lower() not in HTML_EXTENSIONS:
             return None
 
         result = None
@@ -217,9 +266,9 @@ class HtmlConverter(DocumentConverter):
         body_elm = soup.find("body")
         webpage_text = ""
         if body_elm:
-            webpage_text = _CustomMarkdownify().convert_soup(body_elm)
+            webpage_text = _markdownify().convert_soup(body_elm)
         else:
-            webpage_text = _CustomMarkdownify().convert_soup(soup)
+            webpage_text = _markdownify().convert_soup(soup)
 
         assert isinstance(webpage_text, str)
 
@@ -237,7 +286,7 @@ class RSSConverter(DocumentConverter):
     ) -> Union[None, DocumentConverterResult]:
         # Bail if not RSS type
         extension = kwargs.get("file_extension", "")
-        if extension.lower() not in [".xml", ".rss", ".atom"]:
+        if extension.lower() not in RSS_EXTENSIONS:
             return None
         try:
             doc = minidom.parse(local_path)
@@ -347,7 +396,7 @@ class RSSConverter(DocumentConverter):
         try:
             # using bs4 because many RSS feeds have HTML-styled content
             soup = BeautifulSoup(content, "html.parser")
-            return _CustomMarkdownify().convert_soup(soup)
+            return _markdownify().convert_soup(soup)
         except BaseException as _:
             return content
 
@@ -374,7 +423,7 @@ class WikipediaConverter(DocumentConverter):
     ) -> Union[None, DocumentConverterResult]:
         # Bail if not Wikipedia
         extension = kwargs.get("file_extension", "")
-        if extension.lower() not in [".html", ".htm"]:
+        if extension.lower() not in HTML_EXTENSIONS:
             return None
         url = kwargs.get("url", "")
         if not re.search(r"^https?:\/\/[a-zA-Z]{2,3}\.wikipedia.org\/", url):
@@ -403,11 +452,9 @@ class WikipediaConverter(DocumentConverter):
                 assert isinstance(main_title, str)
 
             # Convert the page
-            webpage_text = f"# {main_title}\n\n" + _CustomMarkdownify().convert_soup(
-                body_elm
-            )
+            webpage_text = f"# {main_title}\n\n" + _markdownify().convert_soup(body_elm)
         else:
-            webpage_text = _CustomMarkdownify().convert_soup(soup)
+            webpage_text = _markdownify().convert_soup(soup)
 
         return DocumentConverterResult(
             title=main_title,
@@ -423,7 +470,7 @@ class YouTubeConverter(DocumentConverter):
     ) -> Union[None, DocumentConverterResult]:
         # Bail if not YouTube
         extension = kwargs.get("file_extension", "")
-        if extension.lower() not in [".html", ".htm"]:
+        if extension.lower() not in HTML_EXTENSIONS:
             return None
         url = kwargs.get("url", "")
         if not url.startswith("https://www.youtube.com/watch?"):
@@ -617,7 +664,7 @@ class BingSerpConverter(DocumentConverter):
     def convert(self, local_path, **kwargs) -> Union[None, DocumentConverterResult]:
         # Bail if not a Bing SERP
         extension = kwargs.get("file_extension", "")
-        if extension.lower() not in [".html", ".htm"]:
+        if extension.lower() not in HTML_EXTENSIONS:
             return None
         url = kwargs.get("url", "")
         if not re.search(r"^https://www\.bing\.com/search\?q=", url):
@@ -634,13 +681,12 @@ class BingSerpConverter(DocumentConverter):
 
         # Clean up some formatting
         for tptt in soup.find_all(class_="tptt"):
-            if hasattr(tptt, "string") and tptt.string:
+            if getattr(tptt, "string", None):
                 tptt.string += " "
         for slug in soup.find_all(class_="algoSlug_icon"):
             slug.extract()
 
         # Parse the algorithmic results
-        _markdownify = _CustomMarkdownify()
         results = list()
         for result in soup.find_all(class_="b_algo"):
             # Rewrite redirect urls
@@ -664,7 +710,7 @@ class BingSerpConverter(DocumentConverter):
                         pass
 
             # Convert to markdown
-            md_result = _markdownify.convert_soup(result).strip()
+            md_result = _markdownify().convert_soup(result).strip()
             lines = [line.strip() for line in re.split(r"\n+", md_result)]
             results.append("\n".join([line for line in lines if len(line) > 0]))
 
@@ -777,14 +823,15 @@ class PptxConverter(HtmlConverter):
         if extension.lower() != ".pptx":
             return None
 
-        md_content = ""
+        # Collect each slide's markdown and join once at the end
+        slides_md = []
 
         presentation = pptx.Presentation(local_path)
         slide_num = 0
         for slide in presentation.slides:
             slide_num += 1
 
-            md_content += f"\n\n<!-- Slide number: {slide_num} -->\n"
+            slide_md = f"\n\n<!-- Slide number: {slide_num} -->\n"
 
             title = slide.shapes.title
             for shape in slide.shapes:
@@ -799,7 +846,7 @@ class PptxConverter(HtmlConverter):
 
                     # A placeholder name
                     filename = re.sub(r"\W", "", shape.name) + ".jpg"
-                    md_content += (
+                    slide_md += (
                         "\n!["
                         + (alt_text if alt_text else shape.name)
                         + "]("
@@ -821,33 +868,35 @@ class PptxConverter(HtmlConverter):
                         html_table += "</tr>"
                         first_row = False
                     html_table += "</table></body></html>"
-                    md_content += (
+                    slide_md += (
                         "\n" + self._convert(html_table).text_content.strip() + "\n"
                     )
 
                 # Charts
                 if shape.has_chart:
-                    md_content += self._convert_chart_to_markdown(shape.chart)
+                    slide_md += self._convert_chart_to_markdown(shape.chart)
 
                 # Text areas
                 elif shape.has_text_frame:
                     if shape == title:
-                        md_content += "# " + shape.text.lstrip() + "\n"
+                        slide_md += "# " + shape.text.lstrip() + "\n"
                     else:
-                        md_content += shape.text + "\n"
+                        slide_md += shape.text + "\n"
 
-            md_content = md_content.strip()
+            slide_md = slide_md.rstrip()
 
             if slide.has_notes_slide:
-                md_content += "\n\n### Notes:\n"
+                slide_md += "\n\n### Notes:\n"
                 notes_frame = slide.notes_slide.notes_text_frame
                 if notes_frame is not None:
-                    md_content += notes_frame.text
-                md_content = md_content.strip()
+                    slide_md += notes_frame.text
+                slide_md = slide_md.rstrip()
+
+            slides_md.append(slide_md)
 
         return DocumentConverterResult(
             title=None,
-            text_content=md_content.strip(),
+            text_content="".join(slides_md).strip(),
         )
 
     def _is_picture(self, shape):
@@ -916,6 +965,16 @@ This warning will be removed in future releases.
             except Exception:
                 return None
 
+    def _get_metadata_md(self, local_path, fields, exiftool_path=None) -> str:
+        """Format the requested exiftool metadata fields as 'Field: value' lines."""
+        md_content = ""
+        metadata = self._get_metadata(local_path, exiftool_path)
+        if metadata:
+            for f in fields:
+                if f in metadata:
+                    md_content += f"{f}: {metadata[f]}\n"
+        return md_content
+
 
 class WavConverter(MediaConverter):
     """
@@ -928,25 +987,10 @@ class WavConverter(MediaConverter):
         if extension.lower() != ".wav":
             return None
 
-        md_content = ""
-
         # Add metadata
-        metadata = self._get_metadata(local_path, kwargs.get("exiftool_path"))
-        if metadata:
-            for f in [
-                "Title",
-                "Artist",
-                "Author",
-                "Band",
-                "Album",
-                "Genre",
-                "Track",
-                "DateTimeOriginal",
-                "CreateDate",
-                "Duration",
-            ]:
-                if f in metadata:
-                    md_content += f"{f}: {metadata[f]}\n"
+        md_content = self._get_metadata_md(
+            local_path, AUDIO_METADATA_FIELDS, kwargs.get("exiftool_path")
+        )
 
         # Transcribe
         if IS_AUDIO_TRANSCRIPTION_CAPABLE:
@@ -983,25 +1027,10 @@ class Mp3Converter(WavConverter):
         if extension.lower() != ".mp3":
             return None
 
-        md_content = ""
-
         # Add metadata
-        metadata = self._get_metadata(local_path, kwargs.get("exiftool_path"))
-        if metadata:
-            for f in [
-                "Title",
-                "Artist",
-                "Author",
-                "Band",
-                "Album",
-                "Genre",
-                "Track",
-                "DateTimeOriginal",
-                "CreateDate",
-                "Duration",
-            ]:
-                if f in metadata:
-                    md_content += f"{f}: {metadata[f]}\n"
+        md_content = self._get_metadata_md(
+            local_path, AUDIO_METADATA_FIELDS, kwargs.get("exiftool_path")
+        )
 
         # Transcribe
         if IS_AUDIO_TRANSCRIPTION_CAPABLE:
@@ -1041,28 +1070,13 @@ class ImageConverter(MediaConverter):
     def convert(self, local_path, **kwargs) -> Union[None, DocumentConverterResult]:
         # Bail if not an image
         extension = kwargs.get("file_extension", "")
-        if extension.lower() not in [".jpg", ".jpeg", ".png"]:
+        if extension.lower() not in IMAGE_EXTENSIONS:
             return None
 
-        md_content = ""
-
         # Add metadata
-        metadata = self._get_metadata(local_path, kwargs.get("exiftool_path"))
-        if metadata:
-            for f in [
-                "ImageSize",
-                "Title",
-                "Caption",
-                "Description",
-                "Keywords",
-                "Artist",
-                "Author",
-                "DateTimeOriginal",
-                "CreateDate",
-                "GPSPosition",
-            ]:
-                if f in metadata:
-                    md_content += f"{f}: {metadata[f]}\n"
+        md_content = self._get_metadata_md(
+            local_path, IMAGE_METADATA_FIELDS, kwargs.get("exiftool_path")
+        )
 
         # Try describing the image with GPTV
         llm_client = kwargs.get("llm_client")
@@ -1225,7 +1239,10 @@ class ZipConverter(DocumentConverter):
     - Processes nested files recursively
     - Uses appropriate converters for each file type
     - Preserves formatting of converted content
-    - Cleans up temporary files after processing
+    - Cleans up temporary files after processing (with `cleanup_extracted=False`, files are
+      instead kept in an `extracted_<name>_zip` folder next to the zip file)
+    - Refuses archives whose uncompressed size exceeds `max_extracted_size` (2 GB by default)
+    - Converts contained files serially, or on `max_workers` threads when that is set above 1
     """
 
     def convert(
@@ -1244,60 +1261,90 @@ class ZipConverter(DocumentConverter):
                 text_content=f"[ERROR] No converters available to process zip contents from: {local_path}",
             )
 
-        extracted_zip_folder_name = (
-            f"extracted_{os.path.basename(local_path).replace('.zip', '_zip')}"
-        )
-        extraction_dir = os.path.normpath(
+        zip_name = os.path.basename(local_path)
+        extracted_zip_folder_name = f"extracted_{zip_name.replace('.zip', '_zip')}"
+        cleanup_extracted = kwargs.get("cleanup_extracted", True)
+
+        # Files that are cleaned up go to a fresh temporary directory. Files that are
+        # kept go to a predictable folder next to the zip file, where callers can find them.
+        kept_extraction_dir = os.path.normpath(
             os.path.join(os.path.dirname(local_path), extracted_zip_folder_name)
         )
-        md_content = f"Content from the zip file `{os.path.basename(local_path)}`:\n\n"
+        extraction_dir = None
+        md_content = f"Content from the zip file `{zip_name}`:\n\n"
+
+        # Skip the zip converter to avoid infinite recursion
+        file_converters = [
+            converter
+            for converter in parent_converters
+            if not isinstance(converter, ZipConverter)
+        ]
 
         try:
             # Extract the zip file safely
             with zipfile.ZipFile(local_path, "r") as zipObj:
+                # Safeguard against zip bombs, before anything is extracted
+                max_extracted_size = kwargs.get(
+                    "max_extracted_size", ZIP_MAX_EXTRACTED_SIZE
+                )
+                extracted_size = sum(info.file_size for info in zipObj.infolist())
+                if extracted_size > max_extracted_size:
+                    raise ValueError(
+                        f"Extracted size of {extracted_size} bytes exceeds the limit of {max_extracted_size} bytes"
+                    )
+
                 # Safeguard against path traversal
                 for member in zipObj.namelist():
-                    member_path = os.path.normpath(os.path.join(extraction_dir, member))
+                    member_path = os.path.normpath(
+                        os.path.join(kept_extraction_dir, member)
+                    )
                     if (
-                        not os.path.commonprefix([extraction_dir, member_path])
-                        == extraction_dir
+                        not os.path.commonprefix([kept_extraction_dir, member_path])
+                        == kept_extraction_dir
                     ):
                         raise ValueError(
                             f"Path traversal detected in zip file: {member}"
                         )
 
+                # Only create the extraction directory once the checks have passed
+                if cleanup_extracted:
+                    extraction_dir = os.path.normpath(
+                        tempfile.mkdtemp(prefix=f"{extracted_zip_folder_name}_")
+                    )
+                else:
+                    extraction_dir = kept_extraction_dir
+
                 # Extract all files safely
                 zipObj.extractall(path=extraction_dir)
 
-            # Process each extracted file
+            # Collect the extracted files, in a stable order
+            members = []
             for root, dirs, files in os.walk(extraction_dir):
                 for name in files:
                     file_path = os.path.join(root, name)
-                    relative_path = os.path.relpath(file_path, extraction_dir)
-
-                    # Get file extension
-                    _, file_extension = os.path.splitext(name)
-
-                    # Update kwargs for the file
-                    file_kwargs = kwargs.copy()
-                    file_kwargs["file_extension"] = file_extension
-                    file_kwargs["_parent_converters"] = parent_converters
-
-                    # Try converting the file using available converters
-                    for converter in parent_converters:
-                        # Skip the zip converter to avoid infinite recursion
-                        if isinstance(converter, ZipConverter):
-                            continue
+                    members.append(
+                        (file_path, os.path.relpath(file_path, extraction_dir))
+                    )
 
-                        result = converter.convert(file_path, **file_kwargs)
-                        if result is not None:
-                            md_content += f"\n## File: {relative_path}\n\n"
-                            md_content += result.text_content + "\n\n"
-                            break
+            # Convert the files, keeping their order in the output. Conversion is
+            # serial unless max_workers > 1 (None means serial); threads only pay off
+            # for I/O-bound members (e.g., LLM image descriptions, exiftool, speech
+            # transcription)
+            max_workers = kwargs.get("max_workers") or 1
+            if max_workers > 1 and len(members) > 1:
+                results = self._convert_members_concurrently(
+                    members, file_converters, max_workers, kwargs
+                )
+            else:
+                results = (
+                    self._convert_member(file_path, file_converters, **kwargs)
+                    for file_path, _ in members
+                )
 
-            # Clean up extracted files if specified
-            if kwargs.get("cleanup_extracted", True):
-                shutil.rmtree(extraction_dir)
+            for (file_path, relative_path), result in zip(members, results):
+                if result is not None:
+                    md_content += f"\n## File: {relative_path}\n\n"
+                    md_content += result.text_content + "\n\n"
 
             return DocumentConverterResult(title=None, text_content=md_content.strip())
 
@@ -1316,6 +1363,102 @@ class ZipConverter(DocumentConverter):
                 title=None,
                 text_content=f"[ERROR] Failed to process zip file {local_path}: {str(e)}",
             )
+        finally:
+            # Clean up extracted files if specified, whether or not conversion succeeded
+            if cleanup_extracted and extraction_dir is not None:
+                shutil.rmtree(extraction_dir, ignore_errors=True)
+
+    def _convert_members_concurrently(
+        self,
+        members: List[Tuple[str, str]],
+        converters: List[DocumentConverter],
+        max_workers: int,
+        kwargs: Dict[str, Any],
+    ) -> Iterator[Optional[DocumentConverterResult]]:
+        """Convert the members on a thread pool, yielding the results in member order.
+        On the first failure, pending conversions are cancelled and the error is re-raised.
+        """
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = [
+                executor.submit(self._convert_member, file_path, converters, **kwargs)
+                for file_path, _ in members
+            ]
+            for future in futures:
+                yield future.result()
+        except BaseException:
+            executor.shutdown(cancel_futures=True)
+            raise
+        finally:
+            executor.shutdown()
+
+    def _convert_member(
+        self, file_path: str, converters: List[DocumentConverter], **kwargs: Any
+    ) -> Union[None, DocumentConverterResult]:
+        """Convert one extracted file with the first converter that accepts it."""
+        _, file_extension = os.path.splitext(file_path)
+
+        # Update kwargs for the file
+        file_kwargs = kwargs.copy()
+        file_kwargs["file_extension"] = file_extension
+
+        for converter in converters:
+            result = converter.convert(file_path, **file_kwargs)
+            if result is not None:
+                return result
+        return None
+
+
+def _guess_ext_magic(path: str) -> List[str]:
+    """Use puremagic (a Python implementation of libmagic) to guess a file's extension based on the first few bytes."""
+    # Use puremagic to guess
+    try:
+        guesses = puremagic.magic_file(path)
+
+        # Fix for: https://github.com/microsoft/markitdown/issues/222
+        # If there are no guesses, then try again after trimming leading ASCII whitespaces.
+        # ASCII whitespace characters are those byte values in the sequence b' \t\n\r\x0b\f'
+        # (space, tab, newline, carriage return, vertical tab, form feed).
+        if len(guesses) == 0:
+            # Skip the whitespace a block at a time, rather than byte-by-byte.
+            with open(path, "rb") as file:
+                while True:
+                    block = file.read(4096)
+                    if not block:  # End of file
+                        break
+                    remainder = block.lstrip()
+                    if remainder:
+                        file.seek(file.tell() - len(remainder))
+                        break
+                try:
+                    guesses = puremagic.magic_stream(file)
+                except puremagic.main.PureError:
+                    pass
+
+        extensions = list()
+        for g in guesses:
+            ext = g.extension.strip()
+            if len(ext) > 0:
+                if not ext.startswith("."):
+                    ext = "." + ext
+                if ext not in extensions:
+                    extensions.append(ext)
+        return extensions
+    except FileNotFoundError:
+        pass
+    except IsADirectoryError:
+        pass
+    except PermissionError:
+        pass
+    return []
+
+
+@functools.lru_cache(maxsize=128)
+def _guess_ext_magic_cached(
+    path: str, st_dev: int, st_ino: int, st_size: int, st_mtime_ns: int
+) -> List[str]:
+    """Memoized _guess_ext_magic. The stat fields are part of the key, so a file that is replaced or modified is sniffed again."""
+    return _guess_ext_magic(path)
 
 
 class FileConversionException(BaseException):
@@ -1343,6 +1486,10 @@ class MarkItDown:
     ):
         if requests_session is None:
             self._requests_session = requests.Session()
+            # Retry transient connection failures (with backoff) before giving up
+            adapter = HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.5))
+            self._requests_session.mount("http://", adapter)
+            self._requests_session.mount("https://", adapter)
         else:
             self._requests_session = requests_session
 
@@ -1417,11 +1564,7 @@ class MarkItDown:
 
         # Local path or url
         if isinstance(source, str):
-            if (
-                source.startswith("http://")
-                or source.startswith("https://")
-                or source.startswith("file://")
-            ):
+            if source.startswith(("http://", "https://", "file://")):
                 return self.convert_url(source, **kwargs)
             else:
                 return self.convert_local(source, **kwargs)
@@ -1444,7 +1587,7 @@ class MarkItDown:
         base, ext = os.path.splitext(path)
         self._append_ext(extensions, ext)
 
-        for g in self._guess_ext_magic(path):
+        for g in self._guess_ext_magic_local(path):
             self._append_ext(extensions, g)
 
         # Convert
@@ -1463,12 +1606,15 @@ class MarkItDown:
         fh = os.fdopen(handle, "wb")
         result = None
         try:
-            # Write to the temporary file
-            content = stream.read()
-            if isinstance(content, str):
-                fh.write(content.encode("utf-8"))
-            else:
-                fh.write(content)
+            # Write to the temporary file, a chunk at a time, so the stream is never
+            # held in memory all at once
+            while True:
+                chunk = stream.read(100 * 1024)
+                if not chunk:
+                    break
+                if isinstance(chunk, str):
+                    chunk = chunk.encode("utf-8")
+                fh.write(chunk)
             fh.close()
 
             # Use puremagic to check for more extension options
@@ -1490,10 +1636,11 @@ class MarkItDown:
     def convert_url(
         self, url: str, **kwargs: Any
     ) -> DocumentConverterResult:  # TODO: fix kwargs type
-        # Send a HTTP request to the URL
-        response = self._requests_session.get(url, stream=True)
-        response.raise_for_status()
-        return self.convert_response(response, **kwargs)
+        # Send a HTTP request to the URL. Closing the response returns its
+        # connection to the session's pool, even if the conversion fails.
+        with self._requests_session.get(url, stream=True) as response:
+            response.raise_for_status()
+            return self.convert_response(response, **kwargs)
 
     def convert_response(
         self, response: requests.Response, **kwargs: Any
@@ -1522,8 +1669,8 @@ class MarkItDown:
         fh = os.fdopen(handle, "wb")
         result = None
         try:
-            # Download the file
-            for chunk in response.iter_content(chunk_size=512):
+            # Download the file, in 100 KB chunks
+            for chunk in response.iter_content(chunk_size=100 * 1024):
                 fh.write(chunk)
             fh.close()
 
@@ -1547,9 +1694,30 @@ class MarkItDown:
         self, local_path: str, extensions: List[Union[str, None]], **kwargs
     ) -> DocumentConverterResult:
         error_trace = ""
+
+        # Copy the caller's kwargs and merge in the global options once, rather than
+        # deep-copying them again for every (extension, converter) pair below
+        base_kwargs = copy.deepcopy(kwargs)
+
+        # Copy any additional global options
+        if "llm_client" not in base_kwargs and self._llm_client is not None:
+            base_kwargs["llm_client"] = self._llm_client
+
+        if "llm_model" not in base_kwargs and self._llm_model is not None:
+            base_kwargs["llm_model"] = self._llm_model
+
+        if "style_map" not in base_kwargs and self._style_map is not None:
+            base_kwargs["style_map"] = self._style_map
+
+        if "exiftool_path" not in base_kwargs and self._exiftool_path is not None:
+            base_kwargs["exiftool_path"] = self._exiftool_path
+
+        # Add the list of converters for nested processing
+        base_kwargs["_parent_converters"] = self._page_converters
+
         for ext in extensions + [None]:  # Try last with no extension
             for converter in self._page_converters:
-                _kwargs = copy.deepcopy(kwargs)
+                _kwargs = base_kwargs.copy()
 
                 # Overwrite file_extension appropriately
                 if ext is None:
@@ -1558,22 +1726,6 @@ class MarkItDown:
                 else:
                     _kwargs.update({"file_extension": ext})
 
-                # Copy any additional global options
-                if "llm_client" not in _kwargs and self._llm_client is not None:
-                    _kwargs["llm_client"] = self._llm_client
-
-                if "llm_model" not in _kwargs and self._llm_model is not None:
-                    _kwargs["llm_model"] = self._llm_model
-
-                if "style_map" not in _kwargs and self._style_map is not None:
-                    _kwargs["style_map"] = self._style_map
-
-                if "exiftool_path" not in _kwargs and self._exiftool_path is not None:
-                    _kwargs["exiftool_path"] = self._exiftool_path
-
-                # Add the list of converters for nested processing
-                _kwargs["_parent_converters"] = self._page_converters
-
                 # If we hit an error log it and keep trying
                 try:
                     res = converter.convert(local_path, **_kwargs)
@@ -1582,10 +1734,8 @@ class MarkItDown:
 
                 if res is not None:
                     # Normalize the content
-                    res.text_content = "\n".join(
-                        [line.rstrip() for line in re.split(r"\r?\n", res.text_content)]
-                    )
-                    res.text_content = re.sub(r"\n{3,}", "\n\n", res.text_content)
+                    res.text_content = _TRAILING_WHITESPACE_RE.sub("", res.text_content)
+                    res.text_content = _BLANK_LINES_RE.sub("\n\n", res.text_content)
 
                     # Todo
                     return res
@@ -1613,44 +1763,19 @@ class MarkItDown:
 
     def _guess_ext_magic(self, path):
         """Use puremagic (a Python implementation of libmagic) to guess a file's extension based on the first few bytes."""
-        # Use puremagic to guess
-        try:
-            guesses = puremagic.magic_file(path)
-
-            # Fix for: https://github.com/microsoft/markitdown/issues/222
-            # If there are no guesses, then try again after trimming leading ASCII whitespaces.
-            # ASCII whitespace characters are those byte values in the sequence b' \t\n\r\x0b\f'
-            # (space, tab, newline, carriage return, vertical tab, form feed).
-            if len(guesses) == 0:
-                with open(path, "rb") as file:
-                    while True:
-                        char = file.read(1)
-                        if not char:  # End of file
-                            break
-                        if not char.isspace():
-                            file.seek(file.tell() - 1)
-                            break
-                    try:
-                        guesses = puremagic.magic_stream(file)
-                    except puremagic.main.PureError:
-                        pass
+        return _guess_ext_magic(path)
 
-            extensions = list()
-            for g in guesses:
-                ext = g.extension.strip()
-                if len(ext) > 0:
-                    if not ext.startswith("."):
-                        ext = "." + ext
-                    if ext not in extensions:
-                        extensions.append(ext)
-            return extensions
-        except FileNotFoundError:
-            pass
-        except IsADirectoryError:
-            pass
-        except PermissionError:
-            pass
-        return []
+    def _guess_ext_magic_local(self, path):
+        """Like _guess_ext_magic, but cached per (path, device, inode, size, mtime). Only use this for caller-owned files, not temporary files whose names and inodes may be recycled."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return self._guess_ext_magic(path)
+        return list(
+            _guess_ext_magic_cached(
+                path, st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns
+            )
+        )
 
     def register_page_converter(self, converter: DocumentConverter) -> None:
         """Register a page text converter."""
@@ -2,6 +2,8 @@
 import io
 import os
 import shutil
+import tempfile
+import zipfile
 
 import pytest
 import requests
@@ -271,6 +273,129 @@ def test_markitdown_local() -> None:
     result = markitdown.convert_stream(io.BytesIO(input_data))
     assert "# Test" in result.text_content
 
+    # Test text (str) streams
+    result = markitdown.convert_stream(
+        io.StringIO(input_data.decode("utf-8")), file_extension=".html"
+    )
+    assert "# Test" in result.text_content
+
+
+def test_markitdown_magic_leading_whitespace(tmp_path) -> None:
+    markitdown = MarkItDown()
+
+    # Leading whitespace is skipped a 4096-byte block at a time, so check runs
+    # that end just before, on, and just past a block boundary
+    for whitespace_len in [4095, 4096, 4097, 10000]:
+        path = os.path.join(tmp_path, f"whitespace_{whitespace_len}")
+        with open(path, "wb") as fh:
+            fh.write(
+                b" \t\r\n"[: whitespace_len % 4] + b" \t\r\n" * (whitespace_len // 4)
+            )
+            fh.write(b"%PDF-1.4\n" + b"0" * 64)
+        assert ".pdf" in markitdown._guess_ext_magic(path)
+
+
+def test_markitdown_magic_cache_invalidation(tmp_path) -> None:
+    markitdown = MarkItDown()
+    path = os.path.join(tmp_path, "document")
+    pdf_data = b"%PDF-1.4\n" + b"0" * 64
+    png_data = b"\x89PNG\r\n\x1a\n" + b"0" * (len(pdf_data) - 8)
+
+    with open(path, "wb") as fh:
+        fh.write(pdf_data)
+    assert ".pdf" in markitdown._guess_ext_magic_local(path)
+
+    # Rewritten in place, with the same size, is sniffed again
+    with open(path, "wb") as fh:
+        fh.write(png_data)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert ".png" in markitdown._guess_ext_magic_local(path)
+
+    # Replaced by another file of the same size (and, possibly, the same mtime)
+    replacement = os.path.join(tmp_path, "replacement")
+    with open(replacement, "wb") as fh:
+        fh.write(pdf_data)
+    st = os.stat(path)
+    os.utime(replacement, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.replace(replacement, path)
+    assert ".pdf" in markitdown._guess_ext_magic_local(path)
+
+
+def test_markitdown_zip_size_limit() -> None:
+    markitdown = MarkItDown()
+    zip_path = os.path.join(TEST_FILES_DIR, "test_files.zip")
+
+    # Archives larger than the limit are rejected before extraction
+    result = markitdown.convert(zip_path, max_extracted_size=1)
+    assert result.text_content.startswith("[ERROR] Security error in zip file")
+    assert "exceeds the limit of 1 bytes" in result.text_content
+
+    # The default limit accepts ordinary archives
+    result = markitdown.convert(zip_path)
+    validate_strings(result, XLSX_TEST_STRINGS)
+
+
+def test_markitdown_zip_cleanup(tmp_path, monkeypatch) -> None:
+    markitdown = MarkItDown()
+    extract_root = os.path.join(tmp_path, "extract")
+    os.mkdir(extract_root)
+    monkeypatch.setattr(tempfile, "tempdir", extract_root)
+
+    # The extraction directory is removed after a successful conversion...
+    result = markitdown.convert(os.path.join(TEST_FILES_DIR, "test_files.zip"))
+    validate_strings(result, XLSX_TEST_STRINGS)
+    assert os.listdir(extract_root) == []
+
+    # ...and after a failed one
+    zip_path = os.path.join(tmp_path, "broken.zip")
+    with zipfile.ZipFile(zip_path, "w") as zip_file:
+        zip_file.writestr("broken.ipynb", "not a notebook")
+    result = markitdown.convert(zip_path)
+    assert result.text_content.startswith("[ERROR]")
+    assert os.listdir(extract_root) == []
+
+    # When cleanup is disabled, the files are kept next to the zip file, and the
+    # output is unchanged
+    zip_path = os.path.join(tmp_path, "test_files.zip")
+    shutil.copy(os.path.join(TEST_FILES_DIR, "test_files.zip"), zip_path)
+    result = markitdown.convert(zip_path, cleanup_extracted=False)
+    assert result.text_content.startswith(
+        "Content from the zip file `test_files.zip`:\n"
+    )
+    assert len(os.listdir(os.path.join(tmp_path, "extracted_test_files_zip"))) > 0
+    assert os.listdir(extract_root) == []
+
+    # Nothing is created when the archive is rejected before extraction
+    shutil.rmtree(os.path.join(tmp_path, "extracted_test_files_zip"))
+    result = markitdown.convert(zip_path, cleanup_extracted=False, max_extracted_size=1)
+    assert result.text_content.startswith("[ERROR] Security error in zip file")
+    assert not os.path.exists(os.path.join(tmp_path, "extracted_test_files_zip"))
+    assert os.listdir(extract_root) == []
+
+
+def test_markitdown_zip_max_workers(tmp_path) -> None:
+    markitdown = MarkItDown()
+    zip_path = os.path.join(tmp_path, "test_members.zip")
+    with zipfile.ZipFile(zip_path, "w") as zip_file:
+        for i in range(16):
+            zip_file.writestr(f"member_{i}.txt", f"Contents of member {i}")
+
+    # Concurrent conversion keeps the members in the same order as serial conversion
+    serial = markitdown.convert(zip_path).text_content
+    concurrent = markitdown.convert(zip_path, max_workers=4).text_content
+    assert concurrent == serial
+    assert markitdown.convert(zip_path, max_workers=None).text_content == serial
+    for i in range(16):
+        assert f"## File: member_{i}.txt\n\nContents of member {i}" in concurrent
+
+    # A failing member still fails the whole archive
+    with zipfile.ZipFile(zip_path, "a") as zip_file:
+        zip_file.writestr("broken.ipynb", "not a notebook")
+    result = markitdown.convert(zip_path, max_workers=4)
+    assert result.text_content.startswith("[ERROR]")
+    assert "Expecting value" in result.text_content
+
 
 @pytest.mark.skipif(
     skip_exiftool,